@@ -23,6 +23,9 @@ import (
 	"keystone-gateway/internal/lua"
 )
 
+// healthBody is the static /health response, allocated once
+var healthBody = []byte("OK")
+
 // backend represents a backend server for proxying
 type backend struct {
 	URL   *url.URL
@@ -32,12 +35,13 @@ type backend struct {
 // Gateway is the main entry point for the reverse proxy.
 // Deep module: Hides Chi routing complexity, Lua engine management, backend pooling.
 type Gateway struct {
-	config    *config.Config
-	router    *chi.Mux
-	backends  map[string]*backend
-	transport http.RoundTripper
-	luaEngine *lua.Engine
-	mu        sync.RWMutex
+	config     *config.Config
+	router     *chi.Mux
+	backends   map[string]*backend
+	transport  http.RoundTripper
+	bufferPool httputil.BufferPool
+	luaEngine  *lua.Engine
+	mu         sync.RWMutex
 }
 
 // New creates and initializes a new Gateway instance.
@@ -54,10 +58,11 @@ func New(cfg *config.Config, version string) (*Gateway, error) {
 	router := chi.NewRouter()
 
 	gw := &Gateway{
-		config:    cfg,
-		router:    router,
-		backends:  make(map[string]*backend),
-		transport: createHTTPTransport(),
+		config:     cfg,
+		router:     router,
+		backends:   make(map[string]*backend),
+		transport:  createHTTPTransport(),
+		bufferPool: newBufferPool(),
 	}
 
 	// Wrap transport with metrics instrumentation if enabled
@@ -97,7 +102,7 @@ func New(cfg *config.Config, version string) (*Gateway, error) {
 	// Health check endpoint
 	gw.router.Get("/health", func(w http.ResponseWriter, r *http.Request) {
 		w.WriteHeader(http.StatusOK)
-		w.Write([]byte("OK"))
+		w.Write(healthBody)
 	})
 
 	// Prometheus metrics endpoint
@@ -248,9 +253,7 @@ func (gw *Gateway) setupRoute(r chi.Router, tenant config.Tenant, route config.R
 		if err != nil {
 			return err
 		}
-		handler = http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-			backend.Proxy.ServeHTTP(w, r)
-		})
+		handler = backend.Proxy
 	} else {
 		return fmt.Errorf("route must have either handler or backend")
 	}
@@ -287,15 +290,16 @@ func (gw *Gateway) setupRouteGroup(r chi.Router, tenant config.Tenant, group con
 	return nil
 }
 
-// createLuaHandler creates an HTTP handler that executes a Lua function
+// createLuaHandler creates an HTTP handler that executes a Lua function.
+// The engine is resolved once here, so the per-request path does not re-check it.
 func (gw *Gateway) createLuaHandler(handlerName string) http.HandlerFunc {
-	return func(w http.ResponseWriter, r *http.Request) {
-		if gw.luaEngine == nil {
-			http.Error(w, "Lua engine not initialized", http.StatusInternalServerError)
-			return
-		}
+	engine := gw.luaEngine
+	if engine == nil {
+		return luaEngineMissing
+	}
 
-		if err := gw.luaEngine.ExecuteHandler(handlerName, w, r); err != nil {
+	return func(w http.ResponseWriter, r *http.Request) {
+		if err := engine.ExecuteHandler(handlerName, w, r); err != nil {
 			slog.Error("lua_handler_error",
 				"handler", handlerName,
 				"error", err,
@@ -307,14 +311,16 @@ func (gw *Gateway) createLuaHandler(handlerName string) http.HandlerFunc {
 
 // createLuaMiddleware creates middleware that executes a Lua function
 func (gw *Gateway) createLuaMiddleware(middlewareName string) func(http.Handler) http.Handler {
+	engine := gw.luaEngine
+	if engine == nil {
+		return func(http.Handler) http.Handler {
+			return http.HandlerFunc(luaEngineMissing)
+		}
+	}
+
 	return func(next http.Handler) http.Handler {
 		return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-			if gw.luaEngine == nil {
-				http.Error(w, "Lua engine not initialized", http.StatusInternalServerError)
-				return
-			}
-
-			if err := gw.luaEngine.ExecuteMiddleware(middlewareName, w, r, next); err != nil {
+			if err := engine.ExecuteMiddleware(middlewareName, w, r, next); err != nil {
 				slog.Error("lua_middleware_error",
 					"middleware", middlewareName,
 					"error", err,
@@ -326,6 +332,11 @@ func (gw *Gateway) createLuaMiddleware(middlewareName string) func(http.Handler)
 	}
 }
 
+// luaEngineMissing is served by Lua routes when Lua routing is disabled
+func luaEngineMissing(w http.ResponseWriter, r *http.Request) {
+	http.Error(w, "Lua engine not initialized", http.StatusInternalServerError)
+}
+
 // getBackend retrieves or creates a backend for proxying
 func (gw *Gateway) getBackend(tenant config.Tenant, backendName string) (*backend, error) {
 	// Check if backend already exists
@@ -357,6 +368,7 @@ func (gw *Gateway) getBackend(tenant config.Tenant, backendName string) (*backen
 
 	proxy := httputil.NewSingleHostReverseProxy(u)
 	proxy.Transport = gw.transport
+	proxy.BufferPool = gw.bufferPool
 	proxy.ErrorHandler = gw.proxyErrorHandler
 
 	back := &backend{
@@ -386,12 +398,44 @@ func (gw *Gateway) proxyErrorHandler(w http.ResponseWriter, r *http.Request, err
 	http.Error(w, "Bad Gateway", http.StatusBadGateway)
 }
 
+// proxyBufferSize matches the copy buffer httputil.ReverseProxy allocates when no pool is set
+const proxyBufferSize = 32 * 1024
+
+// bufferPool reuses response copy buffers across all backend proxies
+type bufferPool struct {
+	pool sync.Pool
+}
+
+// newBufferPool creates a buffer pool shared by all reverse proxies
+func newBufferPool() *bufferPool {
+	return &bufferPool{
+		pool: sync.Pool{
+			New: func() any {
+				buf := make([]byte, proxyBufferSize)
+				return &buf
+			},
+		},
+	}
+}
+
+// Get returns a copy buffer from the pool
+func (b *bufferPool) Get() []byte {
+	return *b.pool.Get().(*[]byte)
+}
+
+// Put returns a copy buffer to the pool
+func (b *bufferPool) Put(buf []byte) {
+	b.pool.Put(&buf)
+}
+
 // createHTTPTransport creates a shared HTTP transport with HTTP/2 support and optimal connection tuning
 func createHTTPTransport() *http.Transport {
 	transport := &http.Transport{
 		// Connection pooling
+		// Keep as many idle conns per host as we allow active ones, so bursts
+		// reuse keep-alive connections instead of paying a new TCP/TLS handshake.
 		MaxIdleConns:        100,
-		MaxIdleConnsPerHost: 10,
+		MaxIdleConnsPerHost: 100,
 		MaxConnsPerHost:     100,
 		IdleConnTimeout:     90 * time.Second,
 
@@ -310,17 +310,17 @@ func (e *Engine) pushRequestTable(L *lua.State, r *http.Request) error {
 
 	// req.body = "..." (read body with size limit)
 	// Only read body if Content-Length > 0 (optimization)
+	// Reads only what the body holds (up to MaxBodySize) instead of allocating the full limit
 	if r.Body != nil && r.ContentLength > 0 {
-		bodyBytes := make([]byte, MaxBodySize)
-		n, err := io.ReadFull(r.Body, bodyBytes)
-		if err != nil && err != io.EOF && err != io.ErrUnexpectedEOF {
+		bodyBytes, err := io.ReadAll(io.LimitReader(r.Body, MaxBodySize))
+		if err != nil {
 			// Only log error, don't fail the request
 			slog.Warn("lua_request_body_read_error", "error", err, "component", "lua")
 		}
 
-		if n > 0 {
+		if len(bodyBytes) > 0 {
 			L.PushString("body")
-			L.PushString(string(bodyBytes[:n]))
+			L.PushString(string(bodyBytes))
 			L.RawSet(-3) // Use RawSet for consistency
 		}
 	}
@@ -370,7 +370,8 @@ func (e *Engine) writeResponseFromTable(L *lua.State, w http.ResponseWriter) err
 	// Write response
 	w.WriteHeader(status)
 	if body != "" {
-		if _, err := w.Write([]byte(body)); err != nil {
+		// io.WriteString uses the ResponseWriter's WriteString, skipping the []byte(body) copy
+		if _, err := io.WriteString(w, body); err != nil {
 			return fmt.Errorf("failed to write response body: %w", err)
 		}
 	}
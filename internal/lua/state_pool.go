@@ -13,7 +13,7 @@ import (
 type LuaStatePool struct {
 	pool    chan *lua.State
 	factory func() *lua.State
-	mu      sync.Mutex
+	mu      sync.RWMutex // Get/Put share a read lock; only Close takes it exclusively
 	closed  bool
 
 	// Metrics
@@ -42,14 +42,12 @@ func NewLuaStatePool(size int, factory func() *lua.State) *LuaStatePool {
 // Get retrieves a Lua state from the pool.
 // Blocks until a state is available. Never creates new states dynamically.
 func (p *LuaStatePool) Get() *lua.State {
-	p.mu.Lock()
+	p.mu.RLock()
 	if p.closed {
-		p.mu.Unlock()
+		p.mu.RUnlock()
 		panic("state pool is closed")
 	}
-	p.mu.Unlock()
-
-	start := time.Now()
+	p.mu.RUnlock()
 
 	// Try to get from pool first (non-blocking check)
 	select {
@@ -62,6 +60,9 @@ func (p *LuaStatePool) Get() *lua.State {
 		p.poolMisses.Add(1)
 	}
 
+	// Only time the slow path; hits never read the clock
+	start := time.Now()
+
 	// Block until state available
 	L := <-p.pool
 	waitDuration := time.Since(start)
@@ -76,8 +77,10 @@ func (p *LuaStatePool) Get() *lua.State {
 func (p *LuaStatePool) Put(L *lua.State) {
 	p.activeStates.Add(-1)
 
-	p.mu.Lock()
-	defer p.mu.Unlock()
+	// Read lock is enough: concurrent Puts only send on the channel,
+	// and Close holds the write lock while it closes it.
+	p.mu.RLock()
+	defer p.mu.RUnlock()
 
 	if p.closed {
 		L.Close()